@@ -1,8 +1,14 @@
 # Fitness app v0.3 - Working towards a GUI w/ menu
 
-import csv
+import atexit
+import io
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+import queue
+import threading
+import warnings
 import tkinter as tk
 from tkinter import messagebox
 
@@ -11,38 +17,68 @@ BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 WORKOUT_LOG = DATA_DIR / "workout_log.csv"
+CSV_FIELDNAMES = ("date", "exercise", "sets", "reps", "weight", "total_volume")
+CSV_HEADER = ",".join(CSV_FIELDNAMES) + "\n"
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer
+FLUSH_THRESHOLD = 10_000  # buffered rows before forcing a write
+FLUSH_INTERVAL_MS = 2000  # max time saved rows wait in memory
+SUMMARY_DEBOUNCE_MS = 50  # coalesce summary redraws within this window
+ERROR_POLL_MS = 500  # how often the Tk thread checks for failed saves
 
 
 def get_today():
     """Returns today's date as a string in YYYY-MM-DD format."""
-    return date.today().isoformat()
+    return _iso_date(date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _iso_date(ordinal):
+    """Cached ISO string for a day ordinal; only rebuilt when the day changes."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+# characters that force a CSV field to be quoted
+_UNSAFE = frozenset(',"\n\r')
+
+
+def _esc(name):
+    """Quote a CSV field only if it contains a comma, quote or line break."""
+    if _UNSAFE.isdisjoint(name):
+        return name
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _open_log_file(filepath):
+    """Open filepath for appending through a large buffer.
+
+    Returns (file, need_header); append mode starts at the end of the file,
+    so a position of 0 means the file is empty and still needs its header.
+    """
+    raw = open(filepath, mode="ab", buffering=CSV_BUFFER_SIZE)
+    file = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    return file, raw.tell() == 0
+
+
+def _write_lines(file, lines, need_header):
+    """Write a batch of CSV lines in one call, preceded by the header if needed."""
+    if need_header:
+        file.write(CSV_HEADER)
+    file.write("".join(lines))
 
 
 # EXERCISE CLASS
-class Exercise:
-    """Represents a single strength exercise entry (OOP upgrade)."""
+class Exercise(NamedTuple):
+    """Represents a single strength exercise entry (immutable, unpacks like a tuple)."""
 
-    def __init__(self, name, sets, reps, weight):
-        self.name = name
-        self.sets = sets
-        self.reps = reps
-        self.weight = weight
+    name: str
+    sets: int
+    reps: int
+    weight: float
 
     def volume(self):
         """Return the training volume for this exercise."""
         return self.sets * self.reps * self.weight
 
-    def to_dict(self, workout_date, workout_total_volume):
-        """Convert to dict for saving to CSV."""
-        return {
-            "date": workout_date,
-            "exercise": self.name,
-            "sets": self.sets,
-            "reps": self.reps,
-            "weight": self.weight,
-            "total_volume": workout_total_volume,
-        }
-
     def __str__(self):
         """String representation for listbox / summary."""
         return f"{self.name}: {self.sets} sets x {self.reps} reps @ {self.weight} lbs"
@@ -53,38 +89,76 @@ class Exercise:
 class Workout:
     """A Workout 'has' many Exercise objects (composition)."""
 
+    __slots__ = ("date", "exercises", "_volume_cache")
+
     def __init__(self, workout_date):
         self.date = workout_date
         self.exercises = []
+        self._volume_cache = 0  # running total, kept in step with add_exercise
 
     def add_exercise(self, exercise):
         """Add an Exercise object to this workout."""
         self.exercises.append(exercise)
+        self._volume_cache += exercise.volume()
 
-    def _total_volume_recursive(self, index):
-        """Recursive helper function to compute total volume."""
-        if index < 0:
-            return 0
-        return self.exercises[index].volume() + self._total_volume_recursive(index - 1)
+    def recompute(self):
+        """Rebuild the cached total from scratch (e.g. after changing the exercises list)."""
+        self._volume_cache = sum(
+            sets * reps * weight for _, sets, reps, weight in self.exercises
+        )
+        return self._volume_cache
 
     def total_volume(self):
-        """Public method calling recursive helper."""
-        return self._total_volume_recursive(len(self.exercises) - 1)
+        """Return the summed volume of every exercise in this workout."""
+        return self._volume_cache
+
+    def csv_lines(self):
+        """Return one formatted CSV line per exercise (fixed schema, no csv module)."""
+        # bind loop invariants to locals once, outside the per-row loop
+        d = self.date
+        tv = self.total_volume()
+        esc = _esc
+        return [
+            f"{d},{esc(name)},{sets},{reps},{weight},{tv}\n"
+            for name, sets, reps, weight in self.exercises
+        ]
+
+    @staticmethod
+    def load_history(filepath):
+        """Return a NumPy array of the volume of every exercise saved in filepath.
+
+        Reads only the sets/reps/weight columns and multiplies them in one
+        vectorised step. A header-only log gives an empty array. NumPy is only
+        needed for this method.
+        """
+        import numpy as np
+
+        with warnings.catch_warnings():
+            # a header-only log is valid: no rows, no volume
+            warnings.filterwarnings("ignore", ".*input contained no data", UserWarning)
+            arr = np.loadtxt(
+                filepath,
+                delimiter=",",
+                quotechar='"',
+                skiprows=1,
+                usecols=(2, 3, 4),
+                dtype=np.float64,
+                ndmin=2,
+            ).reshape(-1, 3)
+        return arr[:, 0] * arr[:, 1] * arr[:, 2]
 
     def save_to_csv(self, filepath):
-        """Save the workout to a CSV file using object data."""
-        file_exists = filepath.exists()
-        total_volume = self.total_volume()
+        """Save the workout to a CSV file in one go.
 
-        with open(filepath, mode="a", newline="") as file:
-            fieldnames = ["date", "exercise", "sets", "reps", "weight", "total_volume"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-
-            if not file_exists:
-                writer.writeheader()
+        Standalone (non-GUI) API; the GUI keeps its log open and writes in
+        batches, but both paths share _open_log_file and _write_lines.
+        """
+        total_volume = self.total_volume()
 
-            for ex in self.exercises:
-                writer.writerow(ex.to_dict(self.date, total_volume))
+        file, need_header = _open_log_file(filepath)
+        with file:
+            # whole workout goes out in a single write
+            _write_lines(file, self.csv_lines(), need_header)
 
         print(f"Workout saved to {filepath}! Total Volume: {total_volume} lbs")
 
@@ -102,11 +176,77 @@ class WorkoutAppGUI:
         # current workout model
         self.workout = Workout(get_today())
 
+        # keep the log open for the whole session instead of per save
+        self._open_log()
+        atexit.register(self.close_log)
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+
+        # pending root.after id for the debounced summary label
+        self._summary_after_id = None
+
         # build GUI
         self._build_menu()
         self._build_main_ui()
         self.update_summary()
 
+    # LOG FILE
+    def _open_log(self):
+        # header need is decided once; it goes out with the first batch written
+        self._csv_file, self._need_header = _open_log_file(WORKOUT_LOG)
+
+        # saved CSV lines are buffered and handed to the writer in batches
+        self._pending_rows = []
+        self._flush_after_id = None
+
+        # disk writes happen on a worker thread so the Tk loop never waits on them.
+        # The worker never touches Tk; it reports failures through _save_errors.
+        self._save_queue = queue.Queue()
+        self._save_errors = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        self._errors_after_id = self.root.after(ERROR_POLL_MS, self._poll_save_errors)
+
+    def _writer_loop(self):
+        """Worker thread: write each queued batch of lines, None means stop."""
+        while True:
+            lines = self._save_queue.get()
+            if lines is None:
+                break
+            try:
+                _write_lines(self._csv_file, lines, self._need_header)
+                self._need_header = False
+                self._csv_file.flush()
+            except Exception as err:
+                # keep running so later saves are still written
+                self._save_errors.put(err)
+
+    def _show_save_errors(self):
+        """Show any errors reported by the writer thread (Tk thread only)."""
+        while not self._save_errors.empty():
+            err = self._save_errors.get()
+            messagebox.showerror("Save Error", f"Could not save workout:\n{err}")
+
+    def _poll_save_errors(self):
+        self._show_save_errors()
+        self._errors_after_id = self.root.after(ERROR_POLL_MS, self._poll_save_errors)
+
+    def _flush_pending(self):
+        """Hand all buffered rows to the writer thread as one batch."""
+        self._flush_after_id = None
+        if self._pending_rows:
+            self._save_queue.put(self._pending_rows)
+            self._pending_rows = []
+
+    def close_log(self):
+        """Finish queued writes and close the workout log (safe to call more than once)."""
+        self._flush_pending()
+        if self._writer_thread.is_alive():
+            self._save_queue.put(None)
+            self._writer_thread.join()
+            self._show_save_errors()
+        if not self._csv_file.closed:
+            self._csv_file.close()
+
     # MENU BAR 
     def _build_menu(self):
         menubar = tk.Menu(self.root)
@@ -116,7 +256,7 @@ class WorkoutAppGUI:
         file_menu.add_command(label="New Workout", command=self.new_workout)
         file_menu.add_command(label="Save Workout", command=self.save_workout)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.exit_app)
         menubar.add_cascade(label="File", menu=file_menu)
 
         # help menu
@@ -194,7 +334,7 @@ class WorkoutAppGUI:
         self.exercise_listbox.insert(tk.END, str(ex))
 
         self.clear_inputs()
-        self.update_summary()
+        self._schedule_summary()
 
     def clear_inputs(self):
         """Reset data fields."""
@@ -203,8 +343,15 @@ class WorkoutAppGUI:
         self.reps_var.set("")
         self.weight_var.set("")
 
+    def _schedule_summary(self):
+        """Refresh the summary once things go quiet for SUMMARY_DEBOUNCE_MS."""
+        if self._summary_after_id is not None:
+            self.root.after_cancel(self._summary_after_id)
+        self._summary_after_id = self.root.after(SUMMARY_DEBOUNCE_MS, self.update_summary)
+
     def update_summary(self):
         """Update total volume label."""
+        self._summary_after_id = None
         total = self.workout.total_volume()
         self.summary_label.config(text=f"Total Volume: {total} lbs")
 
@@ -220,7 +367,7 @@ class WorkoutAppGUI:
 
         self.workout = Workout(get_today())
         self.exercise_listbox.delete(0, tk.END)
-        self.update_summary()
+        self._schedule_summary()
         self.clear_inputs()
 
     def save_workout(self):
@@ -229,9 +376,25 @@ class WorkoutAppGUI:
             messagebox.showinfo("Save Workout", "No exercises to save.")
             return
 
-        self.workout.save_to_csv(WORKOUT_LOG)
+        # format the rows now; they reach disk with the next batch
+        self._pending_rows.extend(self.workout.csv_lines())
+        if len(self._pending_rows) >= FLUSH_THRESHOLD:
+            if self._flush_after_id is not None:
+                self.root.after_cancel(self._flush_after_id)
+            self._flush_pending()
+        elif self._flush_after_id is None:
+            self._flush_after_id = self.root.after(FLUSH_INTERVAL_MS, self._flush_pending)
         messagebox.showinfo("Save Workout", "Workout saved successfully!")
 
+    def exit_app(self):
+        """Close the log file and shut down (menu: File → Exit / window close)."""
+        pending = (self._flush_after_id, self._summary_after_id, self._errors_after_id)
+        for after_id in pending:
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self.close_log()
+        self.root.destroy()
+
     def show_about(self):
         """Show About dialog."""
         messagebox.showinfo(